@@ -0,0 +1,22 @@
+"""Filename sanitization shared by the pipeline and the download script."""
+
+from __future__ import annotations
+
+
+class FilenameTable(dict):
+    """``str.translate`` table mapping unsafe filename characters to ``_``.
+
+    Alphanumerics and the characters in ``keep`` are left alone. Entries are
+    filled in lazily so non-ASCII characters are classified with
+    ``str.isalnum`` exactly like the ASCII ones.
+    """
+
+    def __init__(self, keep: str) -> None:
+        super().__init__()
+        self.keep = keep
+
+    def __missing__(self, code: int) -> int:
+        char = chr(code)
+        value = code if char.isalnum() or char in self.keep else ord("_")
+        self[code] = value
+        return value
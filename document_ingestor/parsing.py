@@ -0,0 +1,56 @@
+"""HTML helpers shared by the spiders.
+
+The XPath expressions are compiled once and evaluated directly against the
+lxml tree Scrapy has already parsed, skipping the CSS translation and the
+``Selector`` wrapper created for every match.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+
+from lxml import etree
+
+_TITLE = etree.XPath("string(//title)")
+_HREFS = etree.XPath("//a/@href", smart_strings=False)
+
+
+def page_title(response) -> str | None:
+    """Return the text of the page ``<title>``, or ``None`` if it is empty."""
+    return _TITLE(response.selector.root) or None
+
+
+def page_links(response) -> list[str]:
+    """Return every ``<a href>`` value on the page."""
+    return _HREFS(response.selector.root)
+
+
+def page_urls(response) -> list[str]:
+    """Return the absolute URLs linked from the page, without duplicates.
+
+    Navigation menus and footers repeat many links; dropping them here saves
+    building a ``Request`` that the dupefilter would only discard later.
+    """
+    return list(dict.fromkeys(map(response.urljoin, page_links(response))))
+
+
+def domain_filter(*domains: str) -> Callable[[str], re.Match[str] | None]:
+    """Return a predicate accepting http(s) URLs on ``domains`` or a subdomain.
+
+    Scheme and host are matched case-insensitively, like Scrapy's offsite
+    middleware.
+
+    The predicate is a compiled pattern's ``match`` method, so using it with
+    ``filter`` keeps the per-link check in C. Rejecting offsite links here
+    saves building a ``Request`` the offsite middleware would discard.
+
+    With no ``domains`` every http(s) URL is accepted, as Scrapy does for a
+    spider without ``allowed_domains``.
+    """
+    if not domains:
+        return re.compile(r"https?://", re.IGNORECASE).match
+    hosts = "|".join(map(re.escape, domains))
+    return re.compile(
+        rf"https?://(?:[^/?#]*\.)?(?:{hosts})(?:[/:?#]|$)", re.IGNORECASE
+    ).match
@@ -8,70 +8,242 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import itertools
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
+from typing import ClassVar
+from urllib.parse import urlparse
 
-import requests
-from docling.document_converter import DocumentConverter
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
+from docling.datamodel.pipeline_options import AcceleratorOptions, PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
 from itemadapter import ItemAdapter
-from w3lib.html import remove_tags
+from selectolax.lexbor import LexborHTMLParser
+from twisted.internet.defer import Deferred, DeferredSemaphore
+from twisted.internet.threads import deferToThread
+
+from document_ingestor.filenames import FilenameTable
+
+_FILENAME_TABLE = FilenameTable(" _-")
+# Docling reports PARTIAL_SUCCESS when some pages fail to parse; the text of
+# the remaining pages is still worth keeping.
+_CONVERTED = {ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS}
 
 
 class DocumentIngestorPipeline:
     """Clean scraped pages and persist them as text files."""
 
-    def __init__(self) -> None:
+    # Bound Docling's memory on pathological PDFs: only the leading pages are
+    # converted, and oversized files fail conversion and get an empty body.
+    PDF_MAX_PAGES = 200
+    PDF_MAX_FILE_SIZE = 64 * 1024 * 1024
+    WRITE_BUFFER_SIZE = 1 << 20
+    BOILERPLATE_TAGS = "script, style, noscript, nav, footer, header"
+    BLOCK_TAGS = (
+        "address, article, aside, blockquote, br, dd, div, dl, dt, figcaption, "
+        "h1, h2, h3, h4, h5, h6, hr, li, main, ol, p, pre, section, table, td, "
+        "th, tr, ul"
+    )
+
+    # Docling loads its layout models lazily and they take hundreds of MB, so
+    # one warmed converter is shared by every pipeline instance in the process,
+    # together with the semaphore bounding the conversions running on it.
+    _converter: ClassVar[DocumentConverter | None] = None
+    _conversions: ClassVar[DeferredSemaphore | None] = None
+    _warmup: ClassVar[Deferred | None] = None
+
+    def __init__(self, workers: int = 1) -> None:
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
-        self.converter = DocumentConverter()
+        self.workers = workers
+
+        # Filename suffixes come from a per-process random salt and a counter,
+        # and timestamps are cached per second, to avoid syscalls per item.
+        self._name_salt = int.from_bytes(os.urandom(4))
+        self._name_counter = itertools.count()
+        self._ts = 0.0
+        self._retrieved_at = ""
+
+    @staticmethod
+    def _build_converter(workers: int) -> DocumentConverter:
+        # pypdfium is roughly twice as fast as docling-parse and uses far less
+        # memory; we only need the text, so OCR and table models are skipped.
+        # Split the cores between concurrent conversions to avoid oversubscription.
+        pipeline_options = PdfPipelineOptions(
+            do_ocr=False,
+            do_table_structure=False,
+            accelerator_options=AcceleratorOptions(
+                num_threads=max(1, (os.cpu_count() or 1) // workers)
+            ),
+        )
+        return DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=pipeline_options,
+                    backend=PyPdfiumDocumentBackend,
+                )
+            }
+        )
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(workers=crawler.settings.getint("PDF_CONVERSION_WORKERS", 2))
 
     def _sanitize_filename(self, name: str) -> str:
-        safe = "".join(c if c.isalnum() or c in (" ", "_", "-") else "_" for c in name)
-        safe = safe.strip().replace(" ", "_")
+        safe = name.translate(_FILENAME_TABLE).strip().replace(" ", "_")
         return safe[:50] if safe else "document"
 
-    def _extract_pdf_text(self, url: str, body: bytes | str | None) -> str:
+    def _extract_html_text(self, html: str) -> str:
+        # Drop scripts, styles and page chrome before extracting visible text
+        tree = LexborHTMLParser(html)
+        for node in tree.css(self.BOILERPLATE_TAGS):
+            node.decompose()
+        root = tree.body or tree.root
+        if root is None:
+            return ""
+        # Keep one line per block element so paragraphs survive for chunking,
+        # and collapse the source whitespace inside each block. The parser
+        # drops NUL characters from the page, so one marks the block ends.
+        for node in root.css(self.BLOCK_TAGS):
+            node.insert_after("\0")
+        blocks = root.text(separator="", strip=False).split("\0")
+        return "\n".join(filter(None, (" ".join(block.split()) for block in blocks)))
+
+    def _timestamp(self) -> str:
+        now = time.time()
+        if now - self._ts >= 1:
+            self._ts = now
+            self._retrieved_at = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        return self._retrieved_at
+
+    def _extract_pdf_text(self, url: str, body: bytes) -> str:
+        # Redirected downloads may lose the suffix Docling uses for the format
+        name = Path(urlparse(url).path).name or "document"
+        if not name.lower().endswith(".pdf"):
+            name += ".pdf"
+
         try:
-            if isinstance(body, (bytes, bytearray)):
-                source = BytesIO(body)
-            else:
-                source = url
-
-            result = self.converter.convert(source)
-
-            doc = getattr(result, "document", result)
-            if hasattr(doc, "text"):
-                return doc.text
-            if hasattr(doc, "to_text"):
-                return doc.to_text()
-            return str(doc)
+            result = self._converter.convert(
+                DocumentStream(name=name, stream=BytesIO(body)),
+                raises_on_error=False,
+                max_file_size=self.PDF_MAX_FILE_SIZE,
+                page_range=(1, self.PDF_MAX_PAGES),
+            )
         except Exception as exc:  # noqa: BLE001
             # Log and return empty string on failure
             print(f"Failed to extract PDF from {url}: {exc}")
             return ""
+        if result.status not in _CONVERTED:
+            print(f"Failed to extract PDF from {url}: {result.status}")
+            return ""
+        return result.document.export_to_text()
+
+    def _convert_pdf(self, item: dict, adapter: ItemAdapter, spider) -> Deferred:
+        # Docling is CPU heavy; run it on the reactor thread pool so the
+        # downloader keeps fetching while PDFs convert. Each item is converted
+        # as soon as a worker is free: holding bodies back for a batch keeps
+        # them in Scrapy's scraper slot, which stalls downloads once it holds
+        # more than SCRAPER_SLOT_MAX_ACTIVE_SIZE bytes.
+        d = self._conversions.run(
+            deferToThread,
+            self._extract_pdf_text,
+            adapter.get("url"),
+            adapter.get("body"),
+        )
+        d.addCallback(lambda text: self._finalize(item, adapter, text, spider))
+        return d
+
+    def open_spider(self, spider):
+        # Output files are written by a background thread so the reactor only
+        # enqueues work; the files are synced to disk once at close.
+        self._writer_queue: queue.Queue[tuple[Path, str] | None] = queue.Queue()
+        self._writer = threading.Thread(target=self._write_files, daemon=True)
+        self._writer.start()
+
+        cls = type(self)
+        if cls._warmup is None:
+            cls._converter = self._build_converter(self.workers)
+            cls._conversions = DeferredSemaphore(self.workers)
+            # Load the PDF models off the reactor thread before items arrive
+            cls._warmup = deferToThread(
+                cls._converter.initialize_pipeline, InputFormat.PDF
+            )
+            cls._warmup.addErrback(
+                lambda failure: print(f"Failed to warm up Docling: {failure.value}")
+            )
+
+        # Every spider waits for the shared warm-up, including ones opened
+        # while it is still running on another thread.
+        ready = Deferred()
+        cls._warmup.addCallback(lambda result: ready.callback(None) or result)
+        return ready
+
+    def close_spider(self, spider):
+        return deferToThread(self._stop_writer)
+
+    def _write_files(self) -> None:
+        written: list[Path] = []
+        while (entry := self._writer_queue.get()) is not None:
+            path, text = entry
+            try:
+                data = memoryview(text.encode("utf-8"))
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    while data:
+                        data = data[os.write(fd, data[: self.WRITE_BUFFER_SIZE]) :]
+                finally:
+                    os.close(fd)
+                written.append(path)
+            except Exception as exc:  # noqa: BLE001
+                # Keep the writer alive so later files are still written
+                print(f"Failed to write {path}: {exc}")
+
+        # Flush this spider's files once the queue is drained, off the hot path
+        for path in written:
+            try:
+                fd = os.open(path, os.O_WRONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except Exception as exc:  # noqa: BLE001
+                print(f"Failed to sync {path}: {exc}")
+
+    def _stop_writer(self) -> None:
+        self._writer_queue.put(None)
+        self._writer.join()
 
     def process_item(self, item: dict, spider):
         adapter = ItemAdapter(item)
+        body = adapter.get("body")
+
+        # Spiders send response.body (bytes) only for PDFs and response.text
+        # for HTML pages, so the type decides the branch even when a PDF link
+        # redirected to a URL without a .pdf suffix.
+        if isinstance(body, bytes):
+            return self._convert_pdf(item, adapter, spider)
+
+        text = self._extract_html_text(body or "")
+        return self._finalize(item, adapter, text, spider)
 
+    def _finalize(self, item: dict, adapter: ItemAdapter, text: str, spider):
         url = adapter.get("url")
         title = adapter.get("title") or url or "document"
-        body = adapter.get("body")
-
-        if url and url.lower().endswith(".pdf"):
-            text = self._extract_pdf_text(url, body)
-        else:
-            html = body.decode("utf-8", "ignore") if isinstance(body, (bytes, bytearray)) else str(body)
-            text = remove_tags(html)
 
         adapter["body_text"] = text.strip()
         adapter["source"] = spider.name
-        adapter["retrieved_at"] = datetime.utcnow().isoformat()
+        adapter["retrieved_at"] = self._timestamp()
 
-        filename = f"{self._sanitize_filename(title)}_{uuid.uuid4().hex[:8]}.txt"
+        suffix = f"{self._name_salt ^ next(self._name_counter):08x}"
+        filename = f"{self._sanitize_filename(title)}_{suffix}.txt"
         filepath = self.output_dir / filename
-        filepath.write_text(adapter["body_text"], encoding="utf-8")
+        self._writer_queue.put((filepath, adapter["body_text"]))
 
         if "body" in adapter:
             del adapter["body"]
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
-from scrapy.cmdline import execute
+from scrapy.crawler import CrawlerProcess
+from scrapy.utils.project import get_project_settings
+
+
+def run_spiders(names: list[str] | None = None) -> None:
+    """Run Scrapy spiders by name concurrently in a single process.
+
+    With no names, every spider registered in ``SPIDER_MODULES`` is run.
+    """
+    process = CrawlerProcess(get_project_settings())
+    for name in names if names is not None else process.spider_loader.list():
+        process.crawl(name)
+    process.start()
 
 
 def run_spider(name: str) -> None:
     """Execute a Scrapy spider by name."""
-    execute(["scrapy", "crawl", name])
+    run_spiders([name])
+
+
+def run_all() -> None:
+    """Run every spider on one reactor, sharing startup cost and DNS cache."""
+    run_spiders()
 
 
 def crawl_atlassian() -> None:
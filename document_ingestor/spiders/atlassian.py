@@ -1,20 +1,21 @@
-import scrapy
+from document_ingestor.parsing import page_title
+from document_ingestor.spiders.base import DocumentSpider, pdf_fallback
 
 
-class AtlassianSpider(scrapy.Spider):
+class AtlassianSpider(DocumentSpider):
     name = "atlassian"
     allowed_domains = ["atlassian.com"]
     start_urls = ["https://atlassian.com/agile"]
     max_depth = 2
 
+    @pdf_fallback
     def parse(self, response):
         # Capture the current page
         yield {
             "url": response.url,
-            "title": response.css("title::text").get(),
+            "title": page_title(response),
             "body": response.text,
         }
 
         if response.meta.get("depth", 0) < self.max_depth:
-            for href in response.css("a::attr(href)").getall():
-                yield response.follow(href, callback=self.parse)
+            yield from self.follow_links(response)
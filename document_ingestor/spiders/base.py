@@ -0,0 +1,49 @@
+import functools
+
+import scrapy
+from scrapy.http import TextResponse
+
+from document_ingestor.parsing import domain_filter, page_urls
+
+
+def pdf_fallback(parse):
+    """Send non-text responses reaching ``parse`` to ``parse_pdf`` instead.
+
+    Links are routed on their ``.pdf`` suffix, so a PDF served from a URL
+    without one (``/download?id=1``) arrives at the page callback as a plain
+    ``Response`` with no ``text`` to extract.
+    """
+
+    @functools.wraps(parse)
+    def wrapper(self, response, *args, **kwargs):
+        if not isinstance(response, TextResponse):
+            return self.parse_pdf(response)
+        return parse(self, response, *args, **kwargs)
+
+    return wrapper
+
+
+class DocumentSpider(scrapy.Spider):
+    """Common link following and PDF handling for the document spiders."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Compiled per instance so allowed_domains given as a spider argument
+        # is honoured
+        self._follow = domain_filter(*getattr(self, "allowed_domains", None) or ())
+
+    def follow_links(self, response, callback=None):
+        """Follow on-site links, sending PDFs to ``parse_pdf``."""
+        callback = callback or self.parse
+        for url in filter(self._follow, page_urls(response)):
+            if url.lower().endswith(".pdf"):
+                yield response.follow(url, callback=self.parse_pdf)
+            else:
+                yield response.follow(url, callback=callback)
+
+    def parse_pdf(self, response):
+        yield {
+            "url": response.url,
+            "title": response.url.rsplit("/", 1)[-1],
+            "body": response.body,
+        }
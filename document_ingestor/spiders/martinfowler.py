@@ -1,33 +1,34 @@
-import scrapy
+from document_ingestor.parsing import page_title
+from document_ingestor.spiders.base import DocumentSpider, pdf_fallback
 
 
-class MartinfowlerSpider(scrapy.Spider):
+class MartinfowlerSpider(DocumentSpider):
     name = "martinfowler"
     allowed_domains = ["martinfowler.com"]
     start_urls = ["https://martinfowler.com"]
     max_depth = 2
 
+    @pdf_fallback
     def parse(self, response):
         if response.url.rstrip("/").endswith("agile.html"):
-            for href in response.css("a::attr(href)").getall():
-                yield response.follow(href, callback=self.parse_article)
+            yield from self.follow_links(response, self.parse_article)
         else:
             yield {
                 "url": response.url,
-                "title": response.css("title::text").get(),
+                "title": page_title(response),
                 "body": response.text,
             }
 
             if response.meta.get("depth", 0) < self.max_depth:
-                for href in response.css("a::attr(href)").getall():
-                    yield response.follow(href, callback=self.parse)
+                yield from self.follow_links(response)
 
             if response.url.rstrip("/") == "https://martinfowler.com":
                 yield response.follow("/agile.html", callback=self.parse)
 
+    @pdf_fallback
     def parse_article(self, response):
         yield {
             "url": response.url,
-            "title": response.css("title::text").get(),
+            "title": page_title(response),
             "body": response.text,
         }
@@ -1,19 +1,20 @@
-import scrapy
+from document_ingestor.parsing import page_title
+from document_ingestor.spiders.base import DocumentSpider, pdf_fallback
 
 
-class ScrumguidesSpider(scrapy.Spider):
+class ScrumguidesSpider(DocumentSpider):
     name = "scrumguides"
     allowed_domains = ["scrumguides.org"]
     start_urls = ["https://scrumguides.org/docs/scrumguide"]
     max_depth = 1
 
+    @pdf_fallback
     def parse(self, response):
         yield {
             "url": response.url,
-            "title": response.css("title::text").get(),
+            "title": page_title(response),
             "body": response.text,
         }
 
         if response.meta.get("depth", 0) < self.max_depth:
-            for href in response.css("a::attr(href)").getall():
-                yield response.follow(href, callback=self.parse)
+            yield from self.follow_links(response)
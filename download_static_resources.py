@@ -8,22 +8,45 @@ Usage:
 import json
 import os
 import argparse
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 from pathlib import Path
+from typing import BinaryIO
 from urllib.parse import urlparse, unquote
-import urllib.request
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from document_ingestor.filenames import FilenameTable
+
+FILENAME_TABLE = FilenameTable(" ._-")
 
 
 def sanitize_filename(name: str) -> str:
     # Replace unsafe characters
-    return (
-        "".join(c if c.isalnum() or c in (" ", ".", "_", "-") else "_" for c in name)
-        .strip()
-        .replace(" ", "_")
-    )
+    return name.translate(FILENAME_TABLE).strip().replace(" ", "_")
 
 
-def download_resources(resources_path: Path, output_dir: Path):
-    output_dir.mkdir(parents=True, exist_ok=True)
+def create_session(pool_size: int = 32) -> requests.Session:
+    # Reuse keep-alive connections instead of a new TCP+TLS handshake per URL
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_file(session: requests.Session, url: str, f: BinaryIO):
+    with session.get(url, stream=True, timeout=30) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        shutil.copyfileobj(r.raw, f, length=1 << 20)
+
+
+def read_static_entries(resources_path: Path) -> list[dict]:
+    entries = []
     with resources_path.open("r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
@@ -35,27 +58,77 @@ def download_resources(resources_path: Path, output_dir: Path):
                 print(f"Skipping invalid JSON line: {line}")
                 continue
 
-            if entry.get("recommended_crawl_depth") == 0:
-                url = entry.get("url")
-                if not url:
-                    continue
-                # Determine filename
-                parsed = urlparse(url)
-                name = Path(unquote(parsed.path)).name
-                if not name:
-                    # fallback to title
-                    title = entry.get("title", "resource")
-                    name = sanitize_filename(title)
-                # ensure proper extension
-                filepath = output_dir / name
-                if filepath.exists():
-                    print(f"Already downloaded: {name}")
-                    continue
-                print(f"Downloading {url} -> {name}")
-                try:
-                    urllib.request.urlretrieve(url, filepath)
-                except Exception as e:
-                    print(f"Failed to download {url}: {e}")
+            if entry.get("recommended_crawl_depth") == 0 and entry.get("url"):
+                entries.append(entry)
+    return entries
+
+
+def download_one(
+    session: requests.Session,
+    entry: dict,
+    output_dir: Path,
+    host_limits: dict[str, threading.Semaphore],
+):
+    url = entry["url"]
+    # Determine filename
+    parsed = urlparse(url)
+    name = Path(unquote(parsed.path)).name
+    if not name:
+        # fallback to title
+        title = entry.get("title", "resource")
+        name = sanitize_filename(title)
+    # ensure proper extension
+    filepath = output_dir / name
+    try:
+        # Claim the file atomically so entries sharing a name never race
+        f = filepath.open("xb")
+    except FileExistsError:
+        print(f"Already downloaded: {name}")
+        return
+    # Bound concurrent requests per host so a single server isn't hammered
+    with host_limits[parsed.netloc], f:
+        print(f"Downloading {url} -> {name}")
+        try:
+            download_file(session, url, f)
+        except Exception as e:
+            print(f"Failed to download {url}: {e}")
+            # Don't leave a partial file that would be skipped on the next run
+            f.close()
+            filepath.unlink(missing_ok=True)
+
+
+def interleave_hosts(entries: list[dict]) -> list[dict]:
+    # Round-robin across hosts so workers aren't all queued on one host's limit
+    by_host: dict[str, list[dict]] = {}
+    for entry in entries:
+        by_host.setdefault(urlparse(entry["url"]).netloc, []).append(entry)
+    return [
+        entry
+        for group in zip_longest(*by_host.values())
+        for entry in group
+        if entry is not None
+    ]
+
+
+def download_resources(
+    resources_path: Path, output_dir: Path, max_workers: int = 16, per_host: int = 4
+):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    entries = interleave_hosts(read_static_entries(resources_path))
+    host_limits = {
+        urlparse(entry["url"]).netloc: threading.Semaphore(per_host)
+        for entry in entries
+    }
+
+    # Downloads are IO-bound; socket reads release the GIL so threads scale
+    with create_session(pool_size=max_workers) as session:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    lambda entry: download_one(session, entry, output_dir, host_limits),
+                    entries,
+                )
+            )
 
 
 def main():
@@ -71,8 +144,14 @@ def main():
     parser.add_argument(
         "--output", type=Path, default=Path("static_resources"), help="Output directory"
     )
+    parser.add_argument(
+        "--workers", type=int, default=16, help="Number of concurrent downloads"
+    )
+    parser.add_argument(
+        "--per-host", type=int, default=4, help="Concurrent downloads per host"
+    )
     args = parser.parse_args()
-    download_resources(args.resources, args.output)
+    download_resources(args.resources, args.output, args.workers, args.per_host)
 
 
 if __name__ == "__main__":
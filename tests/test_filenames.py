@@ -0,0 +1,12 @@
+from document_ingestor.filenames import FilenameTable
+
+
+def test_keeps_alphanumerics_and_listed_characters():
+    table = FilenameTable(" ._-")
+    assert "Scrum Guide_v2.1-final".translate(table) == "Scrum Guide_v2.1-final"
+    assert "Café Ω".translate(table) == "Café Ω"
+
+
+def test_replaces_everything_else_with_underscore():
+    table = FilenameTable("-")
+    assert "a/b\\c:d?e f.pdf".translate(table) == "a_b_c_d_e_f_pdf"
@@ -0,0 +1,68 @@
+from scrapy.http import HtmlResponse
+
+from document_ingestor.parsing import domain_filter, page_links, page_title, page_urls
+
+
+def make_response(body: str, url: str = "https://example.com/docs/") -> HtmlResponse:
+    return HtmlResponse(url=url, body=body.encode("utf-8"), encoding="utf-8")
+
+
+def test_page_title():
+    assert page_title(make_response("<title>Scrum</title>")) == "Scrum"
+    assert page_title(make_response("<title></title><p>x</p>")) is None
+
+
+def test_page_links_returns_raw_hrefs():
+    response = make_response('<a href="b.html">B</a><a>none</a><a href="/a">A</a>')
+    assert page_links(response) == ["b.html", "/a"]
+
+
+def test_page_urls_resolves_and_deduplicates_in_order():
+    response = make_response(
+        """
+        <a href="b.html">B</a>
+        <a href="/a.html">A</a>
+        <a href="https://example.com/docs/b.html">B again</a>
+        <a href="/a.html">A again</a>
+        """
+    )
+    assert page_urls(response) == [
+        "https://example.com/docs/b.html",
+        "https://example.com/a.html",
+    ]
+
+
+def test_domain_filter_accepts_domain_and_subdomains():
+    follow = domain_filter("atlassian.com")
+    assert follow("https://atlassian.com/agile")
+    assert follow("http://www.atlassian.com")
+    assert follow("https://www.atlassian.com:443/agile")
+    assert follow("https://www.atlassian.com?q=1")
+
+
+def test_domain_filter_is_case_insensitive():
+    follow = domain_filter("atlassian.com")
+    assert follow("HTTPS://WWW.Atlassian.COM/agile")
+
+
+def test_domain_filter_rejects_other_hosts():
+    follow = domain_filter("atlassian.com")
+    assert not follow("https://evilatlassian.com/")
+    assert not follow("https://atlassian.com.evil.com/")
+    assert not follow("https://evil.com/atlassian.com")
+    assert not follow("mailto:someone@atlassian.com")
+    assert not follow("ftp://atlassian.com/")
+
+
+def test_domain_filter_multiple_domains():
+    follow = domain_filter("scrum.org", "scrumguides.org")
+    assert follow("https://scrum.org/")
+    assert follow("https://www.scrumguides.org/guide")
+    assert not follow("https://scrumalliance.org/")
+
+
+def test_domain_filter_without_domains_accepts_any_http_url():
+    follow = domain_filter()
+    assert follow("https://example.com/")
+    assert follow("HTTP://anything.org/page")
+    assert not follow("mailto:someone@example.com")
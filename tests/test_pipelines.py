@@ -0,0 +1,209 @@
+from types import SimpleNamespace
+
+import pytest
+from docling.datamodel.base_models import ConversionStatus
+from scrapy import Spider
+from twisted.internet import defer
+
+from document_ingestor import pipelines
+from document_ingestor.pipelines import DocumentIngestorPipeline
+
+
+class StubConverter:
+    """Stand-in for Docling that returns the PDF bytes as the document text."""
+
+    STATUSES = {
+        "bad": ConversionStatus.FAILURE,
+        "partial": ConversionStatus.PARTIAL_SUCCESS,
+    }
+
+    def __init__(self):
+        self.converted = []
+
+    def convert(self, source, raises_on_error=True, **kwargs):
+        self.converted.append(source.name)
+        text = source.stream.read().decode()
+        document = SimpleNamespace(export_to_text=lambda: text)
+        status = self.STATUSES.get(text, ConversionStatus.SUCCESS)
+        return SimpleNamespace(status=status, document=document)
+
+    def initialize_pipeline(self, input_format):
+        pass
+
+
+@pytest.fixture
+def converter(monkeypatch):
+    converter = StubConverter()
+    monkeypatch.setattr(DocumentIngestorPipeline, "_converter", converter)
+    monkeypatch.setattr(
+        DocumentIngestorPipeline, "_conversions", defer.DeferredSemaphore(1)
+    )
+    monkeypatch.setattr(DocumentIngestorPipeline, "_warmup", defer.succeed(None))
+    return converter
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch, converter):
+    monkeypatch.chdir(tmp_path)
+    # Run conversions and the writer shutdown inline instead of in the pool
+    monkeypatch.setattr(pipelines, "deferToThread", defer.maybeDeferred)
+    pipeline = DocumentIngestorPipeline()
+    spider = Spider(name="test")
+    pipeline.open_spider(spider)
+    yield pipeline, spider
+    if pipeline._writer.is_alive():
+        pipeline._stop_writer()
+
+
+def pdf_item(name: str, body: bytes = b"text") -> dict:
+    return {"url": f"https://example.com/{name}", "title": name, "body": body}
+
+
+def result(d: defer.Deferred):
+    out = []
+    d.addCallback(out.append)
+    [value] = out
+    return value
+
+
+def test_pdf_is_converted_per_item(pipeline, converter):
+    pipeline, spider = pipeline
+
+    first = pipeline.process_item(pdf_item("a.pdf", b"one"), spider)
+    second = pipeline.process_item(pdf_item("b.pdf", b"two"), spider)
+
+    assert converter.converted == ["a.pdf", "b.pdf"]
+    item = result(first)
+    assert item["body_text"] == "one"
+    assert "body" not in item
+    assert result(second)["body_text"] == "two"
+
+
+def test_partial_success_keeps_text(pipeline):
+    pipeline, spider = pipeline
+
+    d = pipeline.process_item(pdf_item("a.pdf", b"partial"), spider)
+
+    assert result(d)["body_text"] == "partial"
+
+
+def test_failed_conversion_gives_empty_text(pipeline):
+    pipeline, spider = pipeline
+
+    d = pipeline.process_item(pdf_item("a.pdf", b"bad"), spider)
+
+    assert result(d)["body_text"] == ""
+
+
+def test_conversions_are_bounded_by_workers(pipeline, monkeypatch):
+    pipeline, spider = pipeline
+    started = []
+
+    def defer_to_thread(f, *args):
+        started.append(defer.Deferred())
+        return started[-1].addCallback(lambda _: f(*args))
+
+    monkeypatch.setattr(pipelines, "deferToThread", defer_to_thread)
+
+    first = pipeline.process_item(pdf_item("a.pdf", b"one"), spider)
+    second = pipeline.process_item(pdf_item("b.pdf", b"two"), spider)
+    assert len(started) == pipeline._conversions.limit == 1
+
+    started[0].callback(None)
+    assert result(first)["body_text"] == "one"
+    assert len(started) == 2
+
+    started[1].callback(None)
+    assert result(second)["body_text"] == "two"
+
+
+def test_close_spider_writes_and_syncs_files(pipeline, tmp_path, monkeypatch):
+    pipeline, spider = pipeline
+    synced = []
+    monkeypatch.setattr(pipelines.os, "fsync", synced.append)
+
+    pipeline.process_item(pdf_item("a.pdf"), spider)
+    pipeline.close_spider(spider)
+
+    assert not pipeline._writer.is_alive()
+    [written] = (tmp_path / "output").iterdir()
+    assert written.name.startswith("a_pdf_")
+    assert written.read_text() == "text"
+    assert len(synced) == 1
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Scrum Guide", "Scrum_Guide"),
+        ("a/b\\c:d?", "a_b_c_d_"),
+        ("  padded  ", "padded"),
+        ("", "document"),
+        ("x" * 80, "x" * 50),
+    ],
+)
+def test_sanitize_filename(name, expected):
+    assert DocumentIngestorPipeline._sanitize_filename(None, name) == expected
+
+
+def test_html_text_drops_boilerplate(pipeline):
+    pipeline, spider = pipeline
+    html = (
+        "<html><head><style>p {}</style></head><body><nav>Menu</nav>"
+        "<p>Hello</p><script>x()</script><footer>Contact</footer></body></html>"
+    )
+
+    assert pipeline._extract_html_text(html) == "Hello"
+
+
+def test_html_text_keeps_paragraph_boundaries(pipeline):
+    pipeline, spider = pipeline
+    html = (
+        "<p>Para one.</p>\n<p>Para <b>two</b>\n   wraps.</p>"
+        "<ul><li>First</li><li>Second</li></ul><div>a<br>b</div>"
+    )
+
+    assert pipeline._extract_html_text(html) == (
+        "Para one.\nPara two wraps.\nFirst\nSecond\na\nb"
+    )
+
+
+def test_bytes_body_without_pdf_suffix_is_converted(pipeline, converter):
+    pipeline, spider = pipeline
+
+    d = pipeline.process_item(pdf_item("download?id=1"), spider)
+
+    assert converter.converted == ["download.pdf"]
+    assert result(d)["body_text"] == "text"
+
+
+def test_str_body_is_not_converted(pipeline, converter):
+    pipeline, spider = pipeline
+    item = {"url": "https://example.com/a.pdf", "title": "Home", "body": "<p>Hi</p>"}
+
+    processed = pipeline.process_item(item, spider)
+
+    assert processed["body_text"] == "Hi"
+    assert processed["source"] == "test"
+    assert converter.converted == []
+
+
+def test_pipelines_share_one_conversion_bound(tmp_path, monkeypatch, converter):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pipelines, "deferToThread", defer.maybeDeferred)
+    monkeypatch.setattr(DocumentIngestorPipeline, "_warmup", None)
+    monkeypatch.setattr(DocumentIngestorPipeline, "_conversions", None)
+    monkeypatch.setattr(
+        DocumentIngestorPipeline,
+        "_build_converter",
+        staticmethod(lambda workers: converter),
+    )
+
+    first, second = DocumentIngestorPipeline(2), DocumentIngestorPipeline(2)
+    for pipeline in (first, second):
+        pipeline.open_spider(Spider(name="test"))
+
+    assert first._conversions is second._conversions
+    assert first._conversions.limit == 2
+    for pipeline in (first, second):
+        pipeline._stop_writer()
@@ -0,0 +1,72 @@
+from scrapy import Request
+from scrapy.http import HtmlResponse, Response
+
+from document_ingestor.spiders.atlassian import AtlassianSpider
+from document_ingestor.spiders.base import DocumentSpider
+from document_ingestor.spiders.martinfowler import MartinfowlerSpider
+
+
+def html_response(url: str, body: str) -> HtmlResponse:
+    return HtmlResponse(
+        url=url, body=body.encode("utf-8"), encoding="utf-8", request=Request(url)
+    )
+
+
+def test_pdf_links_go_to_parse_pdf():
+    spider = AtlassianSpider()
+    response = html_response(
+        "https://atlassian.com/agile",
+        '<title>Agile</title><a href="/guide.pdf">PDF</a><a href="/scrum">Scrum</a>',
+    )
+
+    item, *requests = spider.parse(response)
+
+    assert item["title"] == "Agile"
+    assert [(r.url, r.callback) for r in requests] == [
+        ("https://atlassian.com/guide.pdf", spider.parse_pdf),
+        ("https://atlassian.com/scrum", spider.parse),
+    ]
+
+
+def test_binary_response_without_pdf_suffix_goes_to_parse_pdf():
+    spider = AtlassianSpider()
+    response = Response(url="https://atlassian.com/download?id=1", body=b"%PDF-1.7")
+
+    assert list(spider.parse(response)) == [
+        {
+            "url": "https://atlassian.com/download?id=1",
+            "title": "download?id=1",
+            "body": b"%PDF-1.7",
+        }
+    ]
+
+
+def test_binary_response_in_parse_article_goes_to_parse_pdf():
+    spider = MartinfowlerSpider()
+    response = Response(url="https://martinfowler.com/paper", body=b"%PDF-1.7")
+
+    [item] = spider.parse_article(response)
+
+    assert item["body"] == b"%PDF-1.7"
+
+
+LINKS = '<a href="https://atlassian.com/a">A</a><a href="https://example.com/b">B</a>'
+
+
+def followed(spider: DocumentSpider) -> list[str]:
+    response = html_response("https://atlassian.com/", LINKS)
+    return [request.url for request in spider.follow_links(response)]
+
+
+def test_follow_links_skips_offsite_links():
+    assert followed(AtlassianSpider()) == ["https://atlassian.com/a"]
+
+
+def test_follow_links_honours_allowed_domains_argument():
+    spider = AtlassianSpider(allowed_domains=["example.com"])
+    assert followed(spider) == ["https://example.com/b"]
+
+
+def test_follow_links_without_allowed_domains_follows_everything():
+    spider = DocumentSpider(name="any")
+    assert followed(spider) == ["https://atlassian.com/a", "https://example.com/b"]